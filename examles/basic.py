@@ -8,20 +8,25 @@ def main():
     src_dir = '/path/to/source/directory'
     dst_dir = '/path/to/destination/directory'
 
-    # Create a DirSync instance with default settings
+    # Create a DirSync instance with default settings (contents are
+    # compared via xxHash if the "xxhash" package is installed)
     dir_syncer = DirSync(src_dir, dst_dir)
 
     # Perform the synchronization
     dir_syncer.sync()
 
     # For continuous sync, use:
-    # dir_syncer.sync_forever(interval=60)  # Sync every 60 seconds,
-    #                                       # interrupt by CTRL+C
+    # dir_syncer.sync_forever(interval=60)  # React to filesystem change
+    #                                       # events (poll every 60 seconds
+    #                                       # if no watcher backend is
+    #                                       # available), interrupt by CTRL+C
 
 
 if __name__ == "__main__":
+    # Use logging.INFO for production runs; DEBUG emits a line per
+    # synchronized item and slows large trees down
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s'
         )
     main()
@@ -12,7 +12,12 @@ def main():
     initial_settings = DirSyncSettings(
         sync_mode=SyncMode.FULL,    # Start with FULL mode
         force_copy=True,            # Allow force copying files
-        sync_meta=True              # Sync metadata
+        sync_meta=True,             # Sync metadata
+        walk_workers=8,             # Traverse the source tree with 8 threads
+        hash_workers=8,             # Compare file contents with 8 threads
+        copy_workers=2,             # Throttle writes for a slow destination
+        hash_algorithm='blake3'     # Compare contents via BLAKE3 hashes
+                                    # (requires the "blake3" package)
     )
 
     # Create DirSync instance with the initial settings
@@ -29,13 +34,19 @@ def main():
     dir_syncer.sync()
 
     # For continuous sync, use:
-    # dir_syncer.sync_forever(interval=60)  # Sync every 60 seconds,
+    # dir_syncer.sync_forever(interval=60)  # After an initial full sweep,
+    #                                       # QUICK-mode syncs are driven by
+    #                                       # filesystem change events (or
+    #                                       # polled every 60 seconds if no
+    #                                       # watcher backend is available),
     #                                       # interrupt by CTRL+C
 
 
 if __name__ == "__main__":
+    # Use logging.INFO for production runs; DEBUG emits a line per
+    # synchronized item and slows large trees down
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s'
         )
     main()
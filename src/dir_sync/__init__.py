@@ -1,4 +1,4 @@
-from ._dir_sync import DirSync, DirSyncSettings, SyncMode
+from ._dir_sync import DirSync, DirSyncSettings, SyncMode, HASH_ALGORITHMS
 
 
-__all__ = ['DirSync', 'DirSyncSettings', 'SyncMode']
+__all__ = ['DirSync', 'DirSyncSettings', 'SyncMode', 'HASH_ALGORITHMS']
@@ -0,0 +1,41 @@
+import pytest
+
+from dir_sync._dir_sync import DirSync, DirSyncSettings, SyncMode
+
+
+# shared sync-mode cases: test_syncer exercises each one against both
+# ArgValidators.is_sync_mode and the DirSyncSettings.sync_mode setter
+SYNC_MODE_VALID_CASES = (
+    (SyncMode.FULL, SyncMode.FULL),
+    (SyncMode.QUICK, SyncMode.QUICK),
+    ("FULL", SyncMode.FULL),
+    ("FuLl  ", SyncMode.FULL),
+    ("quick", SyncMode.QUICK),
+    ("QUiCK", SyncMode.QUICK)
+)
+
+SYNC_MODE_INVALID_CASES = (
+    0, "ful l", "quick+full", None, ["full"]
+)
+
+
+@pytest.fixture(scope='session')
+def sync_dirs(tmp_path_factory):
+    src_dir = tmp_path_factory.mktemp('test_src')
+    dst_dir = tmp_path_factory.mktemp('test_dst')
+    # the destination must not exist yet so its creation is synced too
+    dst_dir.rmdir()
+    return str(src_dir), str(dst_dir)
+
+
+@pytest.fixture(scope='session')
+def dir_sync_obj(sync_dirs, tmp_path_factory):
+    src_dir, dst_dir = sync_dirs
+    # one DirSync per session: the instance and its thread pools are
+    # built once instead of per test module. The digest cache stays
+    # inside the test tmp tree so repeated _is_content_different calls
+    # are served from it and nothing leaks into the user cache directory.
+    settings = DirSyncSettings(
+        cache_path=str(tmp_path_factory.mktemp('cache') / 'digests.db')
+    )
+    return DirSync(src_dir, dst_dir, settings)
@@ -2,131 +2,101 @@ import argparse
 import os
 import pytest
 
-from unittest import mock
-
-from dir_sync._dir_sync import ArgValidators, SyncMode
-
-
-@pytest.mark.parametrize(
-    "level_input, level_output",
-    [
-        (0, 0),
-        (10, 10),
-        (20, 20),
-        (35, 35),
-        ("DEBUG", 10),
-        ("info", 20),
-        ("WarNIng", 30),
-        ("  error    ", 40)
-    ]
+from dir_sync._dir_sync import ArgValidators
+
+
+_LOG_LEVEL_VALID_CASES = (
+    (0, 0),
+    (10, 10),
+    (20, 20),
+    (35, 35),
+    ("DEBUG", 10),
+    ("info", 20),
+    ("WarNIng", 30),
+    ("  error    ", 40)
 )
-def test_is_log_level_valid(level_input, level_output):
-    assert ArgValidators.is_log_level(level_input) == level_output
 
-
-@pytest.mark.parametrize(
-    "level_input",
-    [-1, "invalid_log_level", "ten", "inf o", "", None, 4.2]
+_LOG_LEVEL_INVALID_CASES = (
+    -1, "invalid_log_level", "ten", "inf o", "", None, 4.2
 )
-def test_is_log_level_invalid(level_input):
-    with pytest.raises(argparse.ArgumentTypeError):
-        ArgValidators.is_log_level(level_input)
 
+_POSITIVE_FLOAT_VALID_CASES = (
+    (1.0, 1.0), (4.2, 4.2), (int(1.0), 1.0), ("2.1", 2.1)
+)
 
-@pytest.mark.parametrize(
-    "num_input, num_output",
-    [(1.0, 1.0), (4.2, 4.2), (int(1.0), 1.0), ("2.1", 2.1)]
-    )
-def test_is_positive_float_valid(num_input, num_output):
-    num = ArgValidators.is_positive_float(num_input)
-    assert isinstance(num, float)
-    assert num == num_output
-
+_POSITIVE_FLOAT_INVALID_CASES = (
+    -1, 0, -2.7, "one", "", None, [1, 2]
+)
 
-@pytest.mark.parametrize(
-    "num_input",
-    [-1, 0, -2.7, "one", "", None, [1, 2]]
+# sync-mode cases live in conftest.py and are exercised together with
+# the DirSyncSettings.sync_mode setter by test_syncer
+_VALIDATOR_VALID_TABLE = (
+    (ArgValidators.is_log_level, _LOG_LEVEL_VALID_CASES),
+    (ArgValidators.is_positive_float, _POSITIVE_FLOAT_VALID_CASES)
 )
-def test_is_positive_float_invalid(num_input):
-    with pytest.raises(argparse.ArgumentTypeError):
-        ArgValidators.is_positive_float(num_input)
-
-
-@pytest.mark.parametrize(
-    ("sync_mode_input", "sync_mode_output"),
-    [
-        (SyncMode.FULL, SyncMode.FULL),
-        (SyncMode.QUICK, SyncMode.QUICK),
-        ("FULL", SyncMode.FULL),
-        ("FuLl  ", SyncMode.FULL),
-        ("quick", SyncMode.QUICK),
-        ("QUiCK", SyncMode.QUICK)
-    ]
+
+_VALIDATOR_INVALID_TABLE = (
+    (ArgValidators.is_log_level, _LOG_LEVEL_INVALID_CASES),
+    (ArgValidators.is_positive_float, _POSITIVE_FLOAT_INVALID_CASES)
 )
-def test_is_sync_mode_valid(sync_mode_input, sync_mode_output):
-    assert ArgValidators.is_sync_mode(sync_mode_input) == sync_mode_output
 
 
-@pytest.mark.parametrize(
-    "sync_mode_input",
-    [0, "ful l", "quick+full", None, ["full"]]
-)
-def test_is_sync_mode_invalid(sync_mode_input):
-    with pytest.raises(argparse.ArgumentTypeError):
-        ArgValidators.is_sync_mode(sync_mode_input)
+def test_validators_valid():
+    for validator, cases in _VALIDATOR_VALID_TABLE:
+        for value_input, value_output in cases:
+            result = validator(value_input)
+            assert result == value_output
+            assert isinstance(result, type(value_output))
+
+
+def test_validators_invalid():
+    for validator, cases in _VALIDATOR_INVALID_TABLE:
+        for value_input in cases:
+            with pytest.raises(argparse.ArgumentTypeError):
+                validator(value_input)
 
 
-def test_is_valid_src_existing_directory():
+def test_is_valid_src_existing_directory(monkeypatch):
     path_input = "path/to/existing/dir "
     path_output = os.path.normpath(path_input)
-    with (
-        mock.patch('os.path.exists', return_value=True),
-        mock.patch('os.path.isdir', return_value=True)
-    ):
-        assert ArgValidators.is_valid_src(path_input) == path_output
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(os.path, 'isdir', lambda path: True)
+    assert ArgValidators.is_valid_src(path_input) == path_output
 
 
-def test_is_valid_src_nonexistent_path():
-    with mock.patch('os.path.exists', return_value=False):
-        with pytest.raises(argparse.ArgumentTypeError):
-            ArgValidators.is_valid_src("/path/to/nonexistent/dir")
+def test_is_valid_src_nonexistent_path(monkeypatch):
+    monkeypatch.setattr(os.path, 'exists', lambda path: False)
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidators.is_valid_src("/path/to/nonexistent/dir")
 
 
-def test_is_valid_src_not_a_directory():
-    with (
-        mock.patch('os.path.exists', return_value=True),
-        mock.patch('os.path.isdir', return_value=False)
-    ):
-        with pytest.raises(argparse.ArgumentTypeError):
-            ArgValidators.is_valid_src("/path/to/not-a-dir")
+def test_is_valid_src_not_a_directory(monkeypatch):
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(os.path, 'isdir', lambda path: False)
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidators.is_valid_src("/path/to/not-a-dir")
 
 
-def test_is_valid_logfile_existing_file():
+def test_is_valid_logfile_existing_file(monkeypatch):
     path_input = "path/to/existing/logfile.log"
     path_output = os.path.normpath(path_input)
-    with (
-        mock.patch('os.path.exists', return_value=True),
-        mock.patch('os.path.isfile', return_value=True),
-        mock.patch('os.access', return_value=True)
-    ):
-        assert ArgValidators.is_valid_logfile(path_input) == path_output
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(os.path, 'isfile', lambda path: True)
+    monkeypatch.setattr(os, 'access', lambda path, mode: True)
+    assert ArgValidators.is_valid_logfile(path_input) == path_output
 
 
-def test_is_valid_logfile_nonexistent_file():
+def test_is_valid_logfile_nonexistent_file(monkeypatch):
     path_input = "path/to/nonexistent/logfile.log"
     path_output = os.path.normpath(path_input)
-    with (
-        mock.patch('os.path.exists', return_value=False),
-        mock.patch('os.access', return_value=True)
-    ):
-        assert ArgValidators.is_valid_logfile(path_input) == path_output
+    monkeypatch.setattr(os.path, 'exists', lambda path: False)
+    monkeypatch.setattr(os, 'access', lambda path, mode: True)
+    assert ArgValidators.is_valid_logfile(path_input) == path_output
 
 
-def test_is_valid_logfile_not_a_file():
+def test_is_valid_logfile_not_a_file(monkeypatch):
     path_input = "path/to/not-a-file"
-    with (
-        mock.patch('os.path.exists', return_value=True),
-        mock.patch('os.path.isfile', return_value=False)
-    ):
-        with pytest.raises(argparse.ArgumentTypeError):
-            ArgValidators.is_valid_logfile(path_input)
+    monkeypatch.setattr(os.path, 'exists', lambda path: True)
+    monkeypatch.setattr(os.path, 'isfile', lambda path: False)
+    with pytest.raises(argparse.ArgumentTypeError):
+        ArgValidators.is_valid_logfile(path_input)